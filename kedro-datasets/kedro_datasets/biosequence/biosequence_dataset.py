@@ -1,21 +1,135 @@
 """BioSequenceDataset loads and saves data to/from bio-sequence objects to
 file.
 """
+import io
 import warnings
-from copy import deepcopy
+import weakref
+from contextlib import ExitStack
+from itertools import chain, islice
 from pathlib import PurePosixPath
-from typing import Any, Dict, List
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, Optional, Union
 
 import fsspec
 from Bio import SeqIO
+from Bio.Seq import Seq
+from Bio.SeqIO.FastaIO import SimpleFastaParser
+from Bio.SeqIO.QualityIO import FastqGeneralIterator
+from Bio.SeqRecord import SeqRecord
 from kedro.io.core import get_filepath_str, get_protocol_and_path
 
 from kedro_datasets import KedroDeprecationWarning
-from kedro_datasets._io import AbstractDataset
+from kedro_datasets._io import AbstractDataset, DatasetError
 
+try:
+    # ISA-L decompresses gzip several times faster than zlib.
+    from isal import igzip as _gzip
+except ImportError:  # pragma: no cover
+    import gzip as _gzip
 
-class BioSequenceDataset(AbstractDataset[List, List]):
+_READAHEAD_BLOCK_SIZE = 16 * 1024 * 1024
+_UPLOAD_BLOCK_SIZE = 64 * 1024 * 1024
+_CONCURRENT_DOWNLOAD_PROTOCOLS = {"s3", "s3a", "gcs", "gs"}
+_CONCURRENT_DOWNLOAD_THRESHOLD = 64 * 1024 * 1024
+_CONCURRENT_DOWNLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+_CONCURRENT_DOWNLOAD_BATCH_SIZE = 16
+_GZIP_SUFFIXES = {".gz", ".bgz"}
+_TEXT_OPEN_ARGS = ("encoding", "errors", "newline")
+
+
+def _first_word(title: str) -> str:
+    try:
+        return title.split(None, 1)[0]
+    except IndexError:
+        return ""
+
+
+def _parse_fasta(handle: IO) -> Iterator[SeqRecord]:
+    # ``SimpleFastaParser`` skips anything before the first record, which
+    # ``SeqIO.parse`` rejects.
+    first_line = next(iter(handle), None)
+    if first_line is None:
+        return
+    if not first_line.startswith(">"):
+        raise ValueError(
+            "This FASTA file contains comments at the beginning of the file, "
+            "which are not allowed by the 'fasta' parser."
+        )
+    for title, sequence in SimpleFastaParser(chain([first_line], handle)):
+        identifier = _first_word(title)
+        yield SeqRecord(
+            Seq(sequence), id=identifier, name=identifier, description=title
+        )
+
+
+def _parse_fastq(handle: IO) -> Iterator[SeqRecord]:
+    for title, sequence, quality in FastqGeneralIterator(handle):
+        identifier = _first_word(title)
+        # PHRED scores from 0 to 93, as accepted by ``SeqIO.parse``.
+        if quality and (min(quality) < "!" or max(quality) > "~"):
+            raise ValueError(
+                f"Invalid character in quality string of FASTQ record "
+                f"'{identifier}': {quality!r}"
+            )
+        yield SeqRecord(
+            Seq(sequence),
+            id=identifier,
+            name=identifier,
+            description=title,
+            letter_annotations={"phred_quality": [ord(q) - 33 for q in quality]},
+        )
+
+
+# Low-level parsers used instead of ``SeqIO.parse`` for the most common formats.
+_FAST_PARSERS: Dict[str, Callable[[IO], Iterator[SeqRecord]]] = {
+    "fasta": _parse_fasta,
+    "fastq": _parse_fastq,
+    "fastq-sanger": _parse_fastq,
+}
+
+
+# Line width used by ``SeqIO.write`` for each of the FASTA formats.
+_FASTA_WRAP: Dict[str, Optional[int]] = {"fasta": 60, "fasta-2line": None}
+_FASTA_WRITE_BATCH_SIZE = 10_000
+
+
+def _format_fasta(record: SeqRecord, wrap: Optional[int]) -> str:
+    identifier = record.id.replace("\n", " ").replace("\r", " ")
+    description = record.description.replace("\n", " ").replace("\r", " ")
+    if description and description.split(None, 1)[0] == identifier:
+        title = description
+    elif description:
+        title = f"{identifier} {description}"
+    else:
+        title = identifier
+
+    if record.seq is None:
+        raise TypeError(f"SeqRecord (id={record.id}) has None for its sequence.")
+    sequence = str(record.seq)
+    if wrap:
+        lines = (sequence[i : i + wrap] for i in range(0, len(sequence), wrap))
+        return f">{title}\n" + "".join(f"{line}\n" for line in lines)
+    return f">{title}\n{sequence}\n"
+
+
+def _write_fasta(
+    records: Union[SeqRecord, Iterable[SeqRecord]], handle: IO, wrap: Optional[int]
+) -> None:
+    """Write records as ``SeqIO.write`` does, but with one ``write`` call per
+    batch of records instead of several per record."""
+    if isinstance(records, SeqRecord):
+        records = [records]
+    records = iter(records)
+    while True:
+        batch = islice(records, _FASTA_WRITE_BATCH_SIZE)
+        text = "".join(_format_fasta(record, wrap) for record in batch)
+        if not text:
+            break
+        handle.write(text)
+
+
+class BioSequenceDataset(AbstractDataset[Iterable[SeqRecord], Iterator[SeqRecord]]):
     r"""``BioSequenceDataset`` loads and saves data to a sequence file.
+    Records are loaded lazily, as an iterator over ``SeqRecord`` objects.
 
     Example:
 
@@ -37,7 +151,7 @@ class BioSequenceDataset(AbstractDataset[List, List]):
         ...     save_args={"format": "fasta"},
         ... )
         >>> dataset.save(raw_data)
-        >>> sequence_list = dataset.load()
+        >>> sequence_list = list(dataset.load())
         >>>
         >>> assert raw_data[0].id == sequence_list[0].id
         >>> assert raw_data[0].seq == sequence_list[0].seq
@@ -76,72 +190,182 @@ class BioSequenceDataset(AbstractDataset[List, List]):
                 Here you can find all available arguments for `open`:
                 https://filesystem-spec.readthedocs.io/en/latest/api.html#fsspec.spec.AbstractFileSystem.open
                 All defaults are preserved, except `mode`, which is set to `r` when loading
-                and to `w` when saving.
+                and to `w` when saving. For remote filesystems, `cache_type` and
+                `block_size` are set to `readahead` and 16 MB when loading, and
+                `block_size` is set to 64 MB when saving.
+                The `concurrent_download` key controls whether files larger than
+                64 MB are downloaded into memory with concurrent range requests
+                before parsing. It defaults to `True` for S3 and GCS, and to
+                `False` for all other filesystems. Files ending in `.gz` or `.bgz`
+                are loaded with `compression` set to `gzip`, and decompressed with
+                ``isal`` if it is installed. They are saved uncompressed unless
+                `compression` is set in `open_args_save`.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
 
         Note: Here you can find all supported file formats: https://biopython.org/wiki/SeqIO
+
+        Note: When ``load_args`` only specifies ``format`` as ``fasta`` or ``fastq``,
+            records are built with Biopython's low-level ``SimpleFastaParser`` and
+            ``FastqGeneralIterator`` instead of ``SeqIO.parse()``. Only ``id``,
+            ``name``, ``description``, ``seq`` and, for FASTQ, the ``phred_quality``
+            letter annotations are populated on the returned ``SeqRecord`` objects.
+            Likewise, when ``save_args`` only specifies ``format`` as ``fasta`` or
+            ``fasta-2line``, records are formatted in batches instead of with
+            ``SeqIO.write()``, producing the same output.
         """
 
-        _fs_args = deepcopy(fs_args) or {}
-        _fs_open_args_load = _fs_args.pop("open_args_load", {})
-        _fs_open_args_save = _fs_args.pop("open_args_save", {})
-        _credentials = deepcopy(credentials) or {}
+        _fs_args = dict(fs_args) if fs_args else {}
+        _fs_open_args_load = dict(_fs_args.pop("open_args_load", {}))
+        _fs_open_args_save = dict(_fs_args.pop("open_args_save", {}))
+        _credentials = dict(credentials) if credentials else {}
 
         protocol, path = get_protocol_and_path(filepath)
+        self._concurrent_download = _fs_args.pop(
+            "concurrent_download", protocol in _CONCURRENT_DOWNLOAD_PROTOCOLS
+        )
 
         self._filepath = PurePosixPath(path)
         self._protocol = protocol
+        self._filepath_str = get_filepath_str(self._filepath, self._protocol)
         if protocol == "file":
             _fs_args.setdefault("auto_mkdir", True)
+        if self._filepath.suffix in _GZIP_SUFFIXES:
+            _fs_open_args_load.setdefault("compression", "gzip")
 
         self._fs = fsspec.filesystem(self._protocol, **_credentials, **_fs_args)
 
         # Handle default load and save arguments
-        self._load_args = deepcopy(self.DEFAULT_LOAD_ARGS)
+        self._load_args = dict(self.DEFAULT_LOAD_ARGS)
         if load_args is not None:
             self._load_args.update(load_args)
-        self._save_args = deepcopy(self.DEFAULT_SAVE_ARGS)
+        self._save_args = dict(self.DEFAULT_SAVE_ARGS)
         if save_args is not None:
             self._save_args.update(save_args)
 
         _fs_open_args_load.setdefault("mode", "r")
         _fs_open_args_save.setdefault("mode", "w")
+        if protocol != "file":
+            # Sequential parsers read remote files in small chunks, so read
+            # ahead in large blocks to keep the number of requests down.
+            _fs_open_args_load.setdefault("cache_type", "readahead")
+            _fs_open_args_load.setdefault("block_size", _READAHEAD_BLOCK_SIZE)
+            # Larger parts mean fewer requests for multipart uploads.
+            _fs_open_args_save.setdefault("block_size", _UPLOAD_BLOCK_SIZE)
         self._fs_open_args_load = _fs_open_args_load
         self._fs_open_args_save = _fs_open_args_save
 
         self.metadata = metadata
 
-    def _describe(self) -> Dict[str, Any]:
-        return {
+        self._desc = {
             "filepath": self._filepath,
             "protocol": self._protocol,
             "load_args": self._load_args,
             "save_args": self._save_args,
         }
 
-    def _load(self) -> List:
-        load_path = get_filepath_str(self._filepath, self._protocol)
-        with self._fs.open(load_path, **self._fs_open_args_load) as fs_file:
-            return list(SeqIO.parse(handle=fs_file, **self._load_args))
+    def _describe(self) -> Dict[str, Any]:
+        return self._desc
+
+    def _get_parser(self) -> Callable[[IO], Iterator[SeqRecord]]:
+        if self._load_args.keys() == {"format"}:
+            parser = _FAST_PARSERS.get(self._load_args["format"])
+            if parser is not None:
+                return parser
+        return lambda handle: SeqIO.parse(handle=handle, **self._load_args)
+
+    def _load(self) -> Iterator[SeqRecord]:
+        open_args = dict(self._fs_open_args_load)
+        mode = open_args.pop("mode")
+        compression = open_args.pop("compression", None)
+        text_args = {
+            key: open_args.pop(key) for key in _TEXT_OPEN_ARGS if key in open_args
+        }
+
+        # Open the file eagerly, so that a missing file fails on ``load``
+        # rather than on the first iteration.
+        with ExitStack() as stack:
+            if compression not in (None, "gzip"):
+                fs_file = stack.enter_context(
+                    self._fs.open(self._filepath_str, **self._fs_open_args_load)
+                )
+            else:
+                fs_file = stack.enter_context(self._open_binary(open_args))
+                if compression == "gzip":
+                    fs_file = stack.enter_context(_gzip.open(fs_file, "rb"))
+                if "b" not in mode:
+                    fs_file = stack.enter_context(
+                        io.TextIOWrapper(fs_file, **text_args)
+                    )
+            files = stack.pop_all()
+
+        records = self._iter_load(files, fs_file)
+        # The generator only closes the files once it has started, so also close
+        # them when it is discarded before the first record is read.
+        weakref.finalize(records, files.close)
+        return records
+
+    def _open_binary(self, open_args: Dict[str, Any]) -> IO:
+        # Opening the file looks up its size, so no separate request is needed.
+        fs_file = self._fs.open(self._filepath_str, mode="rb", **open_args)
+        size = fs_file.size
+        if self._concurrent_download and size > _CONCURRENT_DOWNLOAD_THRESHOLD:
+            fs_file.close()
+            return self._download(self._filepath_str, size)
+        return fs_file
+
+    def _download(self, load_path: str, size: int) -> IO:
+        """Download the whole file with concurrent range requests, as a single
+        connection is capped well below the available bandwidth. Ranges are
+        requested in batches, so that only one batch is held besides the file."""
+        starts = range(0, size, _CONCURRENT_DOWNLOAD_CHUNK_SIZE)
+        buffer = io.BytesIO()
+        for batch in range(0, len(starts), _CONCURRENT_DOWNLOAD_BATCH_SIZE):
+            batch_starts = starts[batch : batch + _CONCURRENT_DOWNLOAD_BATCH_SIZE]
+            chunks = self._fs.cat_ranges(
+                [load_path] * len(batch_starts),
+                list(batch_starts),
+                [
+                    min(start + _CONCURRENT_DOWNLOAD_CHUNK_SIZE, size)
+                    for start in batch_starts
+                ],
+                on_error="raise",
+            )
+            buffer.writelines(chunks)
+            # Free the batch before the next one is requested.
+            del chunks
+        buffer.seek(0)
+        return buffer
 
-    def _save(self, data: List) -> None:
-        save_path = get_filepath_str(self._filepath, self._protocol)
+    def _iter_load(self, stack: ExitStack, fs_file: IO) -> Iterator[SeqRecord]:
+        parser = self._get_parser()
+        with stack:
+            try:
+                yield from parser(fs_file)
+            except Exception as exc:
+                # Records are parsed after ``load`` returns, so wrap errors as
+                # ``AbstractDataset.load`` does.
+                raise DatasetError(
+                    f"Failed while loading data from data set {str(self)}.\n{str(exc)}"
+                ) from exc
 
-        with self._fs.open(save_path, **self._fs_open_args_save) as fs_file:
-            SeqIO.write(data, handle=fs_file, **self._save_args)
+    def _save(self, data: Iterable[SeqRecord]) -> None:
+        save_format = self._save_args.get("format")
+        with self._fs.open(self._filepath_str, **self._fs_open_args_save) as fs_file:
+            if self._save_args.keys() == {"format"} and save_format in _FASTA_WRAP:
+                _write_fasta(data, fs_file, _FASTA_WRAP[save_format])
+            else:
+                SeqIO.write(data, handle=fs_file, **self._save_args)
 
     def _exists(self) -> bool:
-        load_path = get_filepath_str(self._filepath, self._protocol)
-        return self._fs.exists(load_path)
+        return self._fs.exists(self._filepath_str)
 
     def _release(self) -> None:
         self.invalidate_cache()
 
     def invalidate_cache(self) -> None:
         """Invalidate underlying filesystem caches."""
-        filepath = get_filepath_str(self._filepath, self._protocol)
-        self._fs.invalidate_cache(filepath)
+        self._fs.invalidate_cache(self._filepath_str)
 
 
 _DEPRECATED_CLASSES = {
@@ -1,23 +1,129 @@
 """NetworkX ``GraphMLDataset`` loads and saves graphs to a GraphML file using an underlying
 filesystem (e.g.: local, S3, GCS). NetworkX is used to create GraphML data.
 """
+import io
+import mmap
+import os
 import warnings
-from copy import deepcopy
 from pathlib import PurePosixPath
-from typing import Any, Dict
+from typing import IO, Any, Dict, Iterator, Optional, Tuple
+from xml.etree import ElementTree
 
 import fsspec
 import networkx
 from kedro.io.core import Version, get_filepath_str, get_protocol_and_path
+from networkx.readwrite.graphml import GraphMLReader
 
 from kedro_datasets import KedroDeprecationWarning
 from kedro_datasets._io import AbstractVersionedDataset
 
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover
+    etree = None
+
+_READAHEAD_BLOCK_SIZE = 16 * 1024 * 1024
+_STREAMING_LOAD_ARGS = {"node_type", "edge_key_type", "force_multigraph"}
+
+
+def _iterparse(source: IO, events: Tuple[str, ...]) -> Iterator:
+    """Parse incrementally with lxml's C parser when it is installed, and with
+    the standard library otherwise. lxml only reads from binary files."""
+    if etree is not None and not isinstance(source, io.TextIOBase):
+        return etree.iterparse(
+            source, events=events, huge_tree=True, resolve_entities=False
+        )
+    return ElementTree.iterparse(source, events=events)
+
+
+class _StreamingGraphMLReader(GraphMLReader):
+    """``GraphMLReader`` that builds the graph while the document is parsed
+    incrementally, instead of building the whole element tree first.
+    Top-level ``node`` and ``edge`` elements are discarded once added.
+    As NetworkX adds all nodes before any edge, edges are held back from the
+    first one which precedes one of its nodes.
+    """
+
+    def read(self, source: IO) -> Optional[networkx.Graph]:
+        """Read the first graph from ``source``, or return None if no
+        namespaced ``graph`` element is found."""
+        graph_tag = f"{{{self.NS_GRAPHML}}}graph"
+        node_tag = f"{{{self.NS_GRAPHML}}}node"
+        edge_tag = f"{{{self.NS_GRAPHML}}}edge"
+        hyperedge_tag = f"{{{self.NS_GRAPHML}}}hyperedge"
+
+        stack = []
+        pending_edges = []
+        for event, element in _iterparse(source, events=("start", "end")):
+            if event == "start":
+                stack.append(element)
+                if len(stack) == 2 and element.tag == graph_tag:  # noqa: PLR2004
+                    keys, defaults = self.find_graphml_keys(stack[0])
+                    graph = self._new_graph(element, keys, defaults)
+                continue
+
+            stack.pop()
+            if len(stack) == 1 and element.tag == graph_tag:
+                for edge in pending_edges:
+                    self.add_edge(graph, edge, keys)
+                return self._finalise_graph(graph, element, keys)
+            if len(stack) != 2 or stack[1].tag != graph_tag:  # noqa: PLR2004
+                continue
+
+            if element.tag == node_tag:
+                self.add_node(graph, element, keys, defaults)
+            elif element.tag == edge_tag:
+                if pending_edges or not self._has_nodes(graph, element):
+                    pending_edges.append(element)
+                else:
+                    self.add_edge(graph, element, keys)
+            elif element.tag == hyperedge_tag:
+                raise networkx.NetworkXError(
+                    "GraphML reader doesn't support hyperedges"
+                )
+            else:
+                continue
+            # Drop the element to free memory. The parser may already have added
+            # later siblings, so it is not necessarily the graph's last child.
+            stack[1].remove(element)
+        return None
+
+    def _has_nodes(self, graph, edge_xml) -> bool:
+        source = self.node_type(edge_xml.get("source"))
+        target = self.node_type(edge_xml.get("target"))
+        return source in graph and target in graph
+
+    def _new_graph(self, graph_xml, graphml_keys, defaults) -> networkx.Graph:
+        if graph_xml.get("edgedefault") == "directed":
+            graph = networkx.MultiDiGraph()
+        else:
+            graph = networkx.MultiGraph()
+        graph.graph["node_default"] = {}
+        graph.graph["edge_default"] = {}
+        for key_id, value in defaults.items():
+            key_for = graphml_keys[key_id]["for"]
+            name = graphml_keys[key_id]["name"]
+            python_type = graphml_keys[key_id]["type"]
+            if key_for in ("node", "edge"):
+                graph.graph[f"{key_for}_default"][name] = python_type(value)
+        return graph
+
+    def _finalise_graph(self, graph, graph_xml, graphml_keys) -> networkx.Graph:
+        graph.graph.update(self.decode_data_elements(graphml_keys, graph_xml))
+        if self.multigraph:
+            return graph
+        graph = (
+            networkx.DiGraph(graph) if graph.is_directed() else networkx.Graph(graph)
+        )
+        networkx.set_edge_attributes(graph, values=self.edge_ids, name="id")
+        return graph
+
 
 class GraphMLDataset(AbstractVersionedDataset[networkx.Graph, networkx.Graph]):
     """``GraphMLDataset`` loads and saves graphs to a GraphML file using an
     underlying filesystem (e.g.: local, S3, GCS). NetworkX is used to
-    create GraphML data.
+    create GraphML data. If ``lxml`` is installed, it is used to parse
+    GraphML files opened in binary mode.
     See https://networkx.org/documentation/stable/tutorial.html for details.
 
     Example:
@@ -69,15 +175,18 @@ class GraphMLDataset(AbstractVersionedDataset[networkx.Graph, networkx.Graph]):
                 `open_args_load` and `open_args_save`.
                 Here you can find all available arguments for `open`:
                 https://filesystem-spec.readthedocs.io/en/latest/api.html#fsspec.spec.AbstractFileSystem.open
-                All defaults are preserved, except `mode`, which is set to `r` when loading
-                and to `w` when saving.
+                All defaults are preserved, except `mode`, which is set to `rb` when loading
+                and to `wb` when saving. For remote filesystems, `cache_type` and
+                `block_size` are set to `readahead` and 16 MB when loading. Local
+                files are memory-mapped when loading, unless other `open_args_load`
+                are given.
             metadata: Any arbitrary Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
         """
-        _fs_args = deepcopy(fs_args) or {}
-        _fs_open_args_load = _fs_args.pop("open_args_load", {})
-        _fs_open_args_save = _fs_args.pop("open_args_save", {})
-        _credentials = deepcopy(credentials) or {}
+        _fs_args = dict(fs_args) if fs_args else {}
+        _fs_open_args_load = dict(_fs_args.pop("open_args_load", {}))
+        _fs_open_args_save = dict(_fs_args.pop("open_args_save", {}))
+        _credentials = dict(credentials) if credentials else {}
 
         protocol, path = get_protocol_and_path(filepath, version)
         if protocol == "file":
@@ -94,23 +203,54 @@ class GraphMLDataset(AbstractVersionedDataset[networkx.Graph, networkx.Graph]):
             exists_function=self._fs.exists,
             glob_function=self._fs.glob,
         )
+        self._filepath_str = get_filepath_str(self._filepath, self._protocol)
 
         # Handle default load and save arguments
-        self._load_args = deepcopy(self.DEFAULT_LOAD_ARGS)
+        self._load_args = dict(self.DEFAULT_LOAD_ARGS)
         if load_args is not None:
             self._load_args.update(load_args)
-        self._save_args = deepcopy(self.DEFAULT_SAVE_ARGS)
+        self._save_args = dict(self.DEFAULT_SAVE_ARGS)
         if save_args is not None:
             self._save_args.update(save_args)
         _fs_open_args_load.setdefault("mode", "rb")
         _fs_open_args_save.setdefault("mode", "wb")
+        if protocol != "file":
+            # The XML parser reads in small chunks, so read ahead in large
+            # blocks to keep the number of requests to remote storage down.
+            _fs_open_args_load.setdefault("cache_type", "readahead")
+            _fs_open_args_load.setdefault("block_size", _READAHEAD_BLOCK_SIZE)
         self._fs_open_args_load = _fs_open_args_load
         self._fs_open_args_save = _fs_open_args_save
+        # Local files opened as plain binary files are memory-mapped when loading.
+        self._mmap_load = protocol == "file" and _fs_open_args_load == {"mode": "rb"}
+
+        self._desc = {
+            "filepath": self._filepath,
+            "protocol": self._protocol,
+            "load_args": self._load_args,
+            "save_args": self._save_args,
+            "version": self._version,
+        }
 
     def _load(self) -> networkx.Graph:
         load_path = get_filepath_str(self._get_load_path(), self._protocol)
         with self._fs.open(load_path, **self._fs_open_args_load) as fs_file:
-            return networkx.read_graphml(fs_file, **self._load_args)
+            # Empty files cannot be memory-mapped.
+            if self._mmap_load and os.fstat(fs_file.fileno()).st_size:
+                with mmap.mmap(
+                    fs_file.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mapped_file:
+                    return self._read_graphml(mapped_file)
+            return self._read_graphml(fs_file)
+
+    def _read_graphml(self, source: IO) -> networkx.Graph:
+        if self._load_args.keys() <= _STREAMING_LOAD_ARGS:
+            graph = _StreamingGraphMLReader(**self._load_args).read(source)
+            if graph is not None:
+                return graph
+            # Let NetworkX handle documents without a GraphML namespace.
+            source.seek(0)
+        return networkx.read_graphml(source, **self._load_args)
 
     def _save(self, data: networkx.Graph) -> None:
         save_path = get_filepath_str(self._get_save_path(), self._protocol)
@@ -123,13 +263,7 @@ class GraphMLDataset(AbstractVersionedDataset[networkx.Graph, networkx.Graph]):
         return self._fs.exists(load_path)
 
     def _describe(self) -> Dict[str, Any]:
-        return {
-            "filepath": self._filepath,
-            "protocol": self._protocol,
-            "load_args": self._load_args,
-            "save_args": self._save_args,
-            "version": self._version,
-        }
+        return self._desc
 
     def _release(self) -> None:
         super()._release()
@@ -137,8 +271,7 @@ class GraphMLDataset(AbstractVersionedDataset[networkx.Graph, networkx.Graph]):
 
     def _invalidate_cache(self) -> None:
         """Invalidate underlying filesystem caches."""
-        filepath = get_filepath_str(self._filepath, self._protocol)
-        self._fs.invalidate_cache(filepath)
+        self._fs.invalidate_cache(self._filepath_str)
 
 
 _DEPRECATED_CLASSES = {
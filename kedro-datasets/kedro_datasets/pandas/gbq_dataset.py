@@ -1,10 +1,12 @@
-"""``GBQTableDataset`` loads and saves data from/to Google BigQuery. It uses pandas-gbq
-to read and write from/to BigQuery table.
+"""``GBQTableDataset`` loads and saves data from/to Google BigQuery. It uses the
+BigQuery Storage API and load jobs, or pandas-gbq, to read and write from/to
+BigQuery table.
 """
-import copy
+import json
 import warnings
+from functools import lru_cache
 from pathlib import PurePosixPath
-from typing import Any, Dict, NoReturn, Union
+from typing import Any, Dict, NoReturn, Optional, Union
 
 import fsspec
 import pandas as pd
@@ -16,14 +18,65 @@ from kedro.io.core import (
     get_protocol_and_path,
     validate_on_forbidden_chars,
 )
+from requests.adapters import HTTPAdapter
 
 from kedro_datasets import KedroDeprecationWarning
 from kedro_datasets._io import AbstractDataset, DatasetError
 
+# ``load_args`` and ``save_args`` which can be honoured with the BigQuery client.
+_BQSTORAGE_LOAD_ARGS = {"query", "location", "use_bqstorage_api"}
+_LOAD_JOB_SAVE_ARGS = {"if_exists", "chunk_size", "progress_bar", "location"}
+_HTTP_POOL_SIZE = 20
+# Number of credentials and clients kept for sharing between datasets.
+_CACHE_SIZE = 32
+_WRITE_DISPOSITIONS = {
+    "fail": bigquery.WriteDisposition.WRITE_EMPTY,
+    "replace": bigquery.WriteDisposition.WRITE_TRUNCATE,
+    "append": bigquery.WriteDisposition.WRITE_APPEND,
+}
+
+
+def _to_credentials(
+    credentials: Union[Dict[str, Any], Credentials, None]
+) -> Optional[Credentials]:
+    if isinstance(credentials, dict):
+        try:
+            key = json.dumps(credentials, sort_keys=True)
+        except TypeError:
+            # Credentials which cannot be serialised are not shared.
+            return Credentials(**credentials)
+        return _get_credentials(key)
+    return credentials
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _get_credentials(credentials: str) -> Credentials:
+    return Credentials(**json.loads(credentials))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _get_bq_client(
+    project: Optional[str], credentials: Optional[Credentials], location: Optional[str]
+) -> bigquery.Client:
+    """Create a client, shared by all datasets with the same project, credentials
+    and location. Credentials objects are compared by identity."""
+    client = bigquery.Client(
+        project=project, credentials=credentials, location=location
+    )
+    # Keep connections alive across requests made through the client's session.
+    # Sessions using mutual TLS keep the adapter which holds their certificate.
+    if not client._http.is_mtls:
+        client._http.mount(
+            "https://",
+            HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE),
+        )
+    return client
+
 
 class GBQTableDataset(AbstractDataset[None, pd.DataFrame]):
     """``GBQTableDataset`` loads and saves data from/to Google BigQuery.
-    It uses pandas-gbq to read and write from/to BigQuery table.
+    It uses the BigQuery Storage API and load jobs, or pandas-gbq, to read and
+    write from/to BigQuery table.
 
     Example usage for the
     `YAML API <https://kedro.readthedocs.io/en/stable/data/\
@@ -87,14 +140,24 @@ class GBQTableDataset(AbstractDataset[None, pd.DataFrame]):
                 parameters required to instantiate ``google.oauth2.credentials.Credentials``.
                 Here you can find all the arguments:
                 https://google-auth.readthedocs.io/en/latest/reference/google.oauth2.credentials.html
+                The BigQuery client is shared with other datasets using the same project,
+                credentials and location, so credentials must not be changed afterwards.
             load_args: Pandas options for loading BigQuery table into DataFrame.
                 Here you can find all available arguments:
                 https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.read_gbq.html
-                All defaults are preserved.
+                All defaults are preserved. Unless options other than ``query``
+                and ``location`` are given, or ``use_bqstorage_api`` is False, the
+                table or query results are downloaded with the BigQuery Storage API
+                through the ``google.cloud.bigquery`` client instead.
             save_args: Pandas options for saving DataFrame to BigQuery table.
                 Here you can find all available arguments:
                 https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.DataFrame.to_gbq.html
                 All defaults are preserved, but "progress_bar", which is set to False.
+                Unless options other than ``if_exists``, ``chunk_size``,
+                ``progress_bar`` and ``location`` are given, the DataFrame is
+                uploaded as Parquet in a single load job by the
+                ``google.cloud.bigquery`` client instead, and ``chunk_size`` and
+                ``progress_bar`` are ignored.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
 
@@ -103,40 +166,52 @@ class GBQTableDataset(AbstractDataset[None, pd.DataFrame]):
                 are different.
         """
         # Handle default load and save arguments
-        self._load_args = copy.deepcopy(self.DEFAULT_LOAD_ARGS)
+        self._load_args = dict(self.DEFAULT_LOAD_ARGS)
         if load_args is not None:
             self._load_args.update(load_args)
-        self._save_args = copy.deepcopy(self.DEFAULT_SAVE_ARGS)
+        self._save_args = dict(self.DEFAULT_SAVE_ARGS)
         if save_args is not None:
             self._save_args.update(save_args)
 
         self._validate_location()
         validate_on_forbidden_chars(dataset=dataset, table_name=table_name)
 
-        if isinstance(credentials, dict):
-            credentials = Credentials(**credentials)
-
         self._dataset = dataset
         self._table_name = table_name
         self._project_id = project
-        self._credentials = credentials
-        self._client = bigquery.Client(
-            project=self._project_id,
-            credentials=self._credentials,
-            location=self._save_args.get("location"),
+        self._credentials = _to_credentials(credentials)
+        self._client = _get_bq_client(
+            self._project_id, self._credentials, self._save_args.get("location")
         )
+        self._table_ref = bigquery.TableReference(
+            bigquery.DatasetReference(self._client.project, self._dataset),
+            self._table_name,
+        )
+        self._exists_cache: Optional[bool] = None
 
         self.metadata = metadata
 
-    def _describe(self) -> Dict[str, Any]:
-        return {
+        self._desc = {
             "dataset": self._dataset,
             "table_name": self._table_name,
             "load_args": self._load_args,
             "save_args": self._save_args,
         }
 
+    def _describe(self) -> Dict[str, Any]:
+        return self._desc
+
     def _load(self) -> pd.DataFrame:
+        if self._use_bqstorage_api():
+            query = self._load_args.get("query")
+            if query is None:
+                rows = self._client.list_rows(self._table_ref)
+            else:
+                rows = self._client.query(
+                    query, location=self._load_args.get("location")
+                ).result()
+            return rows.to_dataframe(create_bqstorage_client=True)
+
         sql = f"select * from {self._dataset}.{self._table_name}"  # nosec
         self._load_args.setdefault("query", sql)
         return pd.read_gbq(
@@ -146,20 +221,57 @@ class GBQTableDataset(AbstractDataset[None, pd.DataFrame]):
         )
 
     def _save(self, data: pd.DataFrame) -> None:
-        data.to_gbq(
-            f"{self._dataset}.{self._table_name}",
-            project_id=self._project_id,
-            credentials=self._credentials,
-            **self._save_args,
-        )
+        if self._save_args.keys() <= _LOAD_JOB_SAVE_ARGS:
+            if_exists = self._save_args.get("if_exists", "fail")
+            if if_exists not in _WRITE_DISPOSITIONS:
+                raise DatasetError(f"'{if_exists}' is not valid for if_exists")
+            # ``WRITE_EMPTY`` also writes to an existing empty table, whereas
+            # pandas-gbq fails whenever the table exists.
+            if if_exists == "fail" and self._table_exists():
+                raise DatasetError(
+                    f"Table '{self._dataset}.{self._table_name}' already exists. "
+                    f"Set 'if_exists' to 'append' or 'replace' to write to it."
+                )
+            job_config = bigquery.LoadJobConfig(
+                source_format=bigquery.SourceFormat.PARQUET,
+                write_disposition=_WRITE_DISPOSITIONS[if_exists],
+            )
+            self._client.load_table_from_dataframe(
+                data, f"{self._dataset}.{self._table_name}", job_config=job_config
+            ).result()
+        else:
+            data.to_gbq(
+                f"{self._dataset}.{self._table_name}",
+                project_id=self._project_id,
+                credentials=self._credentials,
+                **self._save_args,
+            )
+        self._exists_cache = True
 
     def _exists(self) -> bool:
-        table_ref = self._client.dataset(self._dataset).table(self._table_name)
+        # Only a table's existence is remembered, as a missing table is usually
+        # about to be created.
+        if self._exists_cache is None:
+            if not self._table_exists():
+                return False
+            self._exists_cache = True
+        return self._exists_cache
+
+    def _table_exists(self) -> bool:
         try:
-            self._client.get_table(table_ref)
-            return True
+            self._client.get_table(self._table_ref)
         except NotFound:
             return False
+        return True
+
+    def invalidate_cache(self) -> None:
+        """Forget whether the table exists, so that it is checked again."""
+        self._exists_cache = None
+
+    def _use_bqstorage_api(self) -> bool:
+        if not self._load_args.keys() <= _BQSTORAGE_LOAD_ARGS:
+            return False
+        return self._load_args.get("use_bqstorage_api", True)
 
     def _validate_location(self):
         save_location = self._save_args.get("location")
@@ -217,6 +329,7 @@ class GBQQueryDataset(AbstractDataset[None, pd.DataFrame]):
         fs_args: Dict[str, Any] = None,
         filepath: str = None,
         metadata: Dict[str, Any] = None,
+        eager_sql: bool = True,
     ) -> None:
         """Creates a new instance of ``GBQQueryDataset``.
 
@@ -230,6 +343,8 @@ class GBQQueryDataset(AbstractDataset[None, pd.DataFrame]):
                 parameters required to instantiate ``google.oauth2.credentials.Credentials``.
                 Here you can find all the arguments:
                 https://google-auth.readthedocs.io/en/latest/reference/google.oauth2.credentials.html
+                The BigQuery client is shared with other datasets using the same project,
+                credentials and location, so credentials must not be changed afterwards.
             load_args: Pandas options for loading BigQuery table into DataFrame.
                 Here you can find all available arguments:
                 https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.read_gbq.html
@@ -240,6 +355,9 @@ class GBQQueryDataset(AbstractDataset[None, pd.DataFrame]):
             filepath: A path to a file with a sql query statement.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
+            eager_sql: Whether to read the sql query from ``filepath`` once, when the
+                dataset is created. Set to False to read the file on every load instead,
+                e.g. when the query is changed between loads.
 
         Raises:
             DatasetError: When ``sql`` and ``filepath`` parameters are either both empty
@@ -258,20 +376,15 @@ class GBQQueryDataset(AbstractDataset[None, pd.DataFrame]):
             )
 
         # Handle default load arguments
-        self._load_args = copy.deepcopy(self.DEFAULT_LOAD_ARGS)
+        self._load_args = dict(self.DEFAULT_LOAD_ARGS)
         if load_args is not None:
             self._load_args.update(load_args)
 
         self._project_id = project
 
-        if isinstance(credentials, dict):
-            credentials = Credentials(**credentials)
-
-        self._credentials = credentials
-        self._client = bigquery.Client(
-            project=self._project_id,
-            credentials=self._credentials,
-            location=self._load_args.get("location"),
+        self._credentials = _to_credentials(credentials)
+        self._client = _get_bq_client(
+            self._project_id, self._credentials, self._load_args.get("location")
         )
 
         # load sql query from arg or from file
@@ -280,7 +393,7 @@ class GBQQueryDataset(AbstractDataset[None, pd.DataFrame]):
             self._filepath = None
         else:
             # filesystem for loading sql file
-            _fs_args = copy.deepcopy(fs_args) or {}
+            _fs_args = dict(fs_args) if fs_args else {}
             _fs_credentials = _fs_args.pop("credentials", {})
             protocol, path = get_protocol_and_path(str(filepath))
 
@@ -288,24 +401,34 @@ class GBQQueryDataset(AbstractDataset[None, pd.DataFrame]):
             self._fs = fsspec.filesystem(self._protocol, **_fs_credentials, **_fs_args)
             self._filepath = path
 
+        self._file_sql = self._read_sql() if self._filepath and eager_sql else None
+
         self.metadata = metadata
 
+        # The load arguments, including the query, do not change after creation.
+        load_args = dict(self._load_args)
+        self._desc = {
+            "sql": str(load_args.pop("query", None)),
+            "filepath": str(self._filepath),
+            "load_args": str(load_args),
+        }
+
     def _describe(self) -> Dict[str, Any]:
-        load_args = copy.deepcopy(self._load_args)
-        desc = {}
-        desc["sql"] = str(load_args.pop("query", None))
-        desc["filepath"] = str(self._filepath)
-        desc["load_args"] = str(load_args)
+        return self._desc
 
-        return desc
+    def _read_sql(self) -> str:
+        load_path = get_filepath_str(PurePosixPath(self._filepath), self._protocol)
+        with self._fs.open(load_path, mode="r") as fs_file:
+            return fs_file.read()
 
     def _load(self) -> pd.DataFrame:
-        load_args = copy.deepcopy(self._load_args)
+        load_args = dict(self._load_args)
 
         if self._filepath:
-            load_path = get_filepath_str(PurePosixPath(self._filepath), self._protocol)
-            with self._fs.open(load_path, mode="r") as fs_file:
-                load_args["query"] = fs_file.read()
+            if self._file_sql is not None:
+                load_args["query"] = self._file_sql
+            else:
+                load_args["query"] = self._read_sql()
 
         return pd.read_gbq(
             project_id=self._project_id,
@@ -32,8 +32,18 @@ pandas_require = {
     "pandas.ExcelDataSet": [PANDAS, "openpyxl>=3.0.6, <4.0"],
     "pandas.DeltaTableDataSet": [PANDAS, "deltalake>=0.10.0"],
     "pandas.FeatherDataSet": [PANDAS],
-    "pandas.GBQTableDataSet": [PANDAS, "pandas-gbq>=0.12.0, <0.18.0"],
-    "pandas.GBQQueryDataSet": [PANDAS, "pandas-gbq>=0.12.0, <0.18.0"],
+    "pandas.GBQTableDataSet": [
+        PANDAS,
+        "pandas-gbq>=0.12.0, <0.18.0",
+        "google-cloud-bigquery[bqstorage,pandas]>=1.24.0",
+        "pyarrow>=1.0",
+    ],
+    "pandas.GBQQueryDataSet": [
+        PANDAS,
+        "pandas-gbq>=0.12.0, <0.18.0",
+        "google-cloud-bigquery[bqstorage,pandas]>=1.24.0",
+        "pyarrow>=1.0",
+    ],
     "pandas.HDFDataSet": [
         PANDAS,
         "tables~=3.6.0; platform_system == 'Windows'",
@@ -172,10 +182,12 @@ extras_require["test"] = [
     "filelock>=3.4.0, <4.0",
     "gcsfs>=2023.1, <2023.3",
     "geopandas>=0.6.0, <1.0",
+    "google-cloud-bigquery[bqstorage,pandas]>=1.24.0",
     "hdfs>=2.5.8, <3.0",
     "holoviews>=1.13.0",
     "import-linter[toml]==1.2.6",
     "ipython>=7.31.1, <8.0",
+    "isal>=1.0",
     "Jinja2<3.1.0",
     "joblib>=0.14",
     "jupyterlab~=3.0",
@@ -1,12 +1,18 @@
+import gc
+import gzip
 import importlib
+from collections.abc import Iterator
 from io import StringIO
-from pathlib import PurePosixPath
+from pathlib import Path, PurePosixPath
 
 import pytest
-from Bio import SeqIO
+from Bio import SeqIO, bgzf
+from Bio.Seq import Seq
+from Bio.SeqRecord import SeqRecord
 from fsspec.implementations.http import HTTPFileSystem
 from fsspec.implementations.local import LocalFileSystem
 from gcsfs import GCSFileSystem
+from isal import igzip
 from kedro.io.core import PROTOCOL_DELIMITER
 from s3fs.core import S3FileSystem
 
@@ -56,7 +62,7 @@ class TestBioSequenceDataset:
     def test_save_and_load(self, biosequence_dataset, dummy_data):
         """Test saving and reloading the data set."""
         biosequence_dataset.save(dummy_data)
-        reloaded = biosequence_dataset.load()
+        reloaded = list(biosequence_dataset.load())
         assert dummy_data[0].id, reloaded[0].id
         assert dummy_data[0].seq, reloaded[0].seq
         assert len(dummy_data) == len(reloaded)
@@ -89,6 +95,285 @@ class TestBioSequenceDataset:
             "mode": "w"
         }  # default unchanged
 
+    def test_load_is_lazy(self, biosequence_dataset, dummy_data, mocker):
+        """Test that records are streamed and the file is closed once consumed."""
+        biosequence_dataset.save(dummy_data)
+        open_spy = mocker.spy(biosequence_dataset._fs, "open")
+        records = biosequence_dataset.load()
+        fs_file = open_spy.spy_return
+
+        assert isinstance(records, Iterator)
+        assert next(records).id == "Alpha"
+        assert not fs_file.closed
+        assert [record.id for record in records] == ["Beta"]
+        assert fs_file.closed
+
+    def test_load_closed_early(self, biosequence_dataset, dummy_data, mocker):
+        """Test that the file is closed when the iterator is not exhausted."""
+        biosequence_dataset.save(dummy_data)
+        open_spy = mocker.spy(biosequence_dataset._fs, "open")
+        records = biosequence_dataset.load()
+        next(records)
+        records.close()
+
+        assert open_spy.spy_return.closed
+
+    def test_load_discarded(self, biosequence_dataset, dummy_data, mocker):
+        """Test that the file is closed when the iterator is discarded unread."""
+        biosequence_dataset.save(dummy_data)
+        open_spy = mocker.spy(biosequence_dataset._fs, "open")
+        records = biosequence_dataset.load()
+        fs_file = open_spy.spy_return
+
+        assert not fs_file.closed
+        del records
+        gc.collect()
+        assert fs_file.closed
+
+    def test_load_parse_error(self, filepath_biosequence):
+        """Check the error when a record cannot be parsed while iterating."""
+        Path(filepath_biosequence).write_text("@Alpha\nACCG\n+\n")
+        dataset = BioSequenceDataset(
+            filepath=filepath_biosequence, load_args={"format": "fastq"}
+        )
+        records = dataset.load()
+
+        pattern = r"Failed while loading data from data set BioSequenceDataset\(.*\)"
+        with pytest.raises(DatasetError, match=pattern):
+            list(records)
+
+    @pytest.mark.parametrize(
+        "file_format,data",
+        [
+            ("fasta", ">Alpha first record\nACCGGATGTA\nCCG\n>Beta\nAGGCTCGGTTA\n"),
+            ("fastq", "@Alpha first record\nACCG\n+\nIIH#\n@Beta\nAGGC\n+\n!!!!\n"),
+            ("fasta", ">\nACCGGATGTA\n"),
+            ("fastq", "@Alpha\nACCG\n+\nII I\n"),
+            ("fasta", "junk\n>Alpha\nACCG\n"),
+            ("fasta", ""),
+        ],
+    )
+    def test_load_fast_parser(self, tmp_path, file_format, data):
+        """Test that the low-level parsers match ``SeqIO.parse``."""
+        filepath = tmp_path / f"test.{file_format}"
+        filepath.write_text(data)
+        dataset = BioSequenceDataset(
+            filepath=str(filepath), load_args={"format": file_format}
+        )
+        try:
+            expected = list(SeqIO.parse(StringIO(data), file_format))
+        except ValueError:
+            with pytest.raises(DatasetError, match="Failed while loading data"):
+                list(dataset.load())
+            return
+        reloaded = list(dataset.load())
+
+        assert len(reloaded) == len(expected)
+        for record, expected_record in zip(reloaded, expected):
+            assert record.id == expected_record.id
+            assert record.name == expected_record.name
+            assert record.description == expected_record.description
+            assert record.seq == expected_record.seq
+            assert record.letter_annotations == expected_record.letter_annotations
+
+    def test_load_fallback_parser(self, filepath_biosequence, dummy_data, mocker):
+        """Test that ``SeqIO.parse`` is used for formats without a fast parser."""
+        SeqIO.write(dummy_data, filepath_biosequence, "fasta-2line")
+        parse_spy = mocker.spy(SeqIO, "parse")
+        dataset = BioSequenceDataset(
+            filepath=filepath_biosequence, load_args={"format": "fasta-2line"}
+        )
+        reloaded = list(dataset.load())
+
+        assert parse_spy.call_count == 1
+        assert [record.id for record in reloaded] == ["Alpha", "Beta"]
+
+    @pytest.mark.parametrize(
+        "fs_args,expected",
+        [
+            (None, {"mode": "r", "cache_type": "readahead", "block_size": 16777216}),
+            (
+                {"open_args_load": {"cache_type": "blockcache", "block_size": 1024}},
+                {"mode": "r", "cache_type": "blockcache", "block_size": 1024},
+            ),
+        ],
+    )
+    def test_remote_open_args_load(self, fs_args, expected):
+        """Test the read-ahead defaults for remote filesystems."""
+        dataset = BioSequenceDataset(filepath="s3://bucket/file.fasta", fs_args=fs_args)
+        assert dataset._fs_open_args_load == expected
+
+    @pytest.mark.parametrize(
+        "filepath,fs_args,expected",
+        [
+            ("s3://bucket/file.fasta", None, True),
+            ("gcs://bucket/file.fasta", None, True),
+            ("s3://bucket/file.fasta", {"concurrent_download": False}, False),
+            ("/tmp/test.fasta", None, False),
+        ],
+    )
+    def test_concurrent_download_default(self, filepath, fs_args, expected):
+        dataset = BioSequenceDataset(filepath=filepath, fs_args=fs_args)
+        assert dataset._concurrent_download is expected
+
+    @pytest.mark.parametrize("fs_args", [{"concurrent_download": True}], indirect=True)
+    def test_load_concurrent_download(self, biosequence_dataset, dummy_data, mocker):
+        """Test that large files are fetched with concurrent range requests."""
+        module = "kedro_datasets.biosequence.biosequence_dataset"
+        mocker.patch(f"{module}._CONCURRENT_DOWNLOAD_THRESHOLD", 0)
+        mocker.patch(f"{module}._CONCURRENT_DOWNLOAD_CHUNK_SIZE", 8)
+        mocker.patch(f"{module}._CONCURRENT_DOWNLOAD_BATCH_SIZE", 2)
+        biosequence_dataset.save(dummy_data)
+        cat_ranges_spy = mocker.spy(biosequence_dataset._fs, "cat_ranges")
+        size_spy = mocker.spy(biosequence_dataset._fs, "size")
+
+        reloaded = list(biosequence_dataset.load())
+
+        size_spy.assert_not_called()
+        starts = [call.args[1] for call in cat_ranges_spy.call_args_list]
+        ends = [call.args[2] for call in cat_ranges_spy.call_args_list]
+        assert starts == [[0, 8], [16, 24], [32]]
+        assert ends == [[8, 16], [24, 32], [36]]
+        assert [record.id for record in reloaded] == ["Alpha", "Beta"]
+        assert [record.seq for record in reloaded] == [r.seq for r in dummy_data]
+
+    def test_fs_args_not_mutated(self, filepath_biosequence):
+        """Test that the arguments passed by the user are left untouched."""
+        fs_args = {"open_args_load": {"encoding": "utf-8"}}
+        BioSequenceDataset(filepath=filepath_biosequence, fs_args=fs_args)
+        assert fs_args == {"open_args_load": {"encoding": "utf-8"}}
+
+    @pytest.mark.parametrize(
+        "filepath,expected",
+        [
+            ("s3://bucket/file.fasta", {"mode": "w", "block_size": 67108864}),
+            ("/tmp/test.fasta", {"mode": "w"}),
+        ],
+    )
+    def test_open_args_save(self, filepath, expected):
+        """Test the upload block size default for remote filesystems."""
+        dataset = BioSequenceDataset(filepath=filepath)
+        assert dataset._fs_open_args_save == expected
+
+    @pytest.mark.parametrize(
+        "suffix,writer",
+        [(".fasta.gz", gzip.open), (".fasta.bgz", bgzf.BgzfWriter)],
+    )
+    def test_load_gzip(self, tmp_path, mocker, suffix, writer):
+        """Test that gzip-compressed files are decompressed with ``isal``."""
+        filepath = str(tmp_path / f"test{suffix}")
+        with writer(filepath, "wb") as fs_file:
+            fs_file.write(b">Alpha\nACCGGATGTA\n>Beta\nAGGCTCGGTTA\n")
+        dataset = BioSequenceDataset(
+            filepath=filepath, load_args=LOAD_ARGS, save_args=SAVE_ARGS
+        )
+        igzip_spy = mocker.spy(igzip, "open")
+
+        reloaded = list(dataset.load())
+
+        assert dataset._fs_open_args_load == {"mode": "r", "compression": "gzip"}
+        assert dataset._fs_open_args_save == {"mode": "w"}
+        assert igzip_spy.call_count == 1
+        assert [record.id for record in reloaded] == ["Alpha", "Beta"]
+
+    @pytest.mark.parametrize(
+        "fs_args",
+        [
+            {
+                "concurrent_download": True,
+                "open_args_load": {"compression": "gzip"},
+                "open_args_save": {"compression": "gzip"},
+            }
+        ],
+        indirect=True,
+    )
+    def test_load_concurrent_download_gzip(
+        self, biosequence_dataset, dummy_data, mocker
+    ):
+        """Test that compressed files can be downloaded concurrently."""
+        mocker.patch(
+            "kedro_datasets.biosequence.biosequence_dataset._CONCURRENT_DOWNLOAD_THRESHOLD",
+            0,
+        )
+        biosequence_dataset.save(dummy_data)
+        cat_ranges_spy = mocker.spy(biosequence_dataset._fs, "cat_ranges")
+
+        reloaded = list(biosequence_dataset.load())
+
+        assert cat_ranges_spy.call_count == 1
+        assert [record.id for record in reloaded] == ["Alpha", "Beta"]
+
+    @pytest.mark.parametrize(
+        "fs_args",
+        [
+            {
+                "open_args_load": {"compression": "bz2", "encoding": "utf-8"},
+                "open_args_save": {"compression": "bz2"},
+            }
+        ],
+        indirect=True,
+    )
+    def test_load_other_compression(self, biosequence_dataset, dummy_data, mocker):
+        """Test that other compressions are left to fsspec."""
+        biosequence_dataset.save(dummy_data)
+        open_spy = mocker.spy(biosequence_dataset._fs, "open")
+
+        reloaded = list(biosequence_dataset.load())
+
+        open_spy.assert_any_call(
+            biosequence_dataset._filepath_str,
+            mode="r",
+            compression="bz2",
+            encoding="utf-8",
+        )
+        assert [record.id for record in reloaded] == ["Alpha", "Beta"]
+
+    @pytest.mark.parametrize("file_format", ["fasta", "fasta-2line"])
+    def test_save_fasta_matches_seqio(self, tmp_path, file_format, mocker):
+        """Test that FASTA records written in batches match ``SeqIO.write``."""
+        records = [
+            SeqRecord(Seq("ACGT" * 40), id="long", description="long record"),
+            SeqRecord(Seq("ACGT" * 15), id="exact", description="exact"),
+            SeqRecord(Seq("ACG"), id="multi\nline", description=""),
+            SeqRecord(Seq(""), id="empty", description="empty\rsequence"),
+        ]
+        mocker.patch(
+            "kedro_datasets.biosequence.biosequence_dataset._FASTA_WRITE_BATCH_SIZE",
+            3,
+        )
+        seqio_spy = mocker.spy(SeqIO, "write")
+        filepath = tmp_path / f"test.{file_format}"
+        dataset = BioSequenceDataset(
+            filepath=str(filepath), save_args={"format": file_format}
+        )
+
+        dataset.save(iter(records))
+
+        seqio_spy.assert_not_called()
+        expected = StringIO()
+        SeqIO.write(records, expected, file_format)
+        assert filepath.read_text() == expected.getvalue()
+
+    def test_save_fasta_single_record(self, biosequence_dataset, dummy_data):
+        """Test that a single record can be saved, as with ``SeqIO.write``."""
+        biosequence_dataset.save(dummy_data[0])
+        reloaded = list(biosequence_dataset.load())
+        assert [record.id for record in reloaded] == ["Alpha"]
+
+    def test_save_fasta_without_sequence(self, biosequence_dataset):
+        """Test that records without a sequence are rejected."""
+        with pytest.raises(DatasetError, match="has None for its sequence"):
+            biosequence_dataset.save([SeqRecord(None, id="missing")])
+
+    def test_save_other_format(self, tmp_path, dummy_data, mocker):
+        """Test that other formats are written by ``SeqIO.write``."""
+        seqio_spy = mocker.spy(SeqIO, "write")
+        dataset = BioSequenceDataset(
+            filepath=str(tmp_path / "test.tab"), save_args={"format": "tab"}
+        )
+        dataset.save(dummy_data)
+        seqio_spy.assert_called_once()
+
     def test_load_missing_file(self, biosequence_dataset):
         """Check the error when trying to load missing file."""
         pattern = r"Failed while loading data from data set BioSequenceDataset\(.*\)"
@@ -114,6 +399,23 @@ class TestBioSequenceDataset:
         assert str(dataset._filepath) == path
         assert isinstance(dataset._filepath, PurePosixPath)
 
+    def test_filesystem_shared(self):
+        """Test that datasets with the same protocol and credentials share
+        one filesystem instance, and therefore its connections."""
+        credentials = {"key": "key", "secret": "secret"}
+        fs_args = {"client_kwargs": {"region_name": "eu-west-1"}}
+        first = BioSequenceDataset(
+            "s3://bucket/a.fasta", credentials=credentials, fs_args=fs_args
+        )
+        second = BioSequenceDataset(
+            "s3://bucket/b.fasta", credentials=credentials, fs_args=fs_args
+        )
+        other = BioSequenceDataset(
+            "s3://bucket/c.fasta", credentials={"key": "other", "secret": "secret"}
+        )
+        assert first._fs is second._fs
+        assert first._fs is not other._fs
+
     def test_catalog_release(self, mocker):
         fs_mock = mocker.patch("fsspec.filesystem").return_value
         filepath = "test.fasta"
@@ -1,4 +1,5 @@
 import importlib
+import mmap
 from pathlib import Path, PurePosixPath
 
 import networkx
@@ -8,6 +9,7 @@ from fsspec.implementations.local import LocalFileSystem
 from gcsfs import GCSFileSystem
 from kedro.io import Version
 from kedro.io.core import PROTOCOL_DELIMITER
+from lxml import etree
 from s3fs.core import S3FileSystem
 
 from kedro_datasets import KedroDeprecationWarning
@@ -74,6 +76,190 @@ class TestGraphMLDataset:
         assert graphml_dataset._fs_open_args_load == {"mode": "rb"}
         assert graphml_dataset._fs_open_args_save == {"mode": "wb"}
 
+    @pytest.mark.parametrize(
+        "graph",
+        [
+            networkx.complete_graph(3, create_using=networkx.DiGraph),
+            networkx.MultiGraph([(0, 1), (0, 1), (1, 2)]),
+            networkx.Graph([(0, 1, {"weight": 1.5}), (1, 2, {"weight": 2.0})]),
+        ],
+    )
+    def test_load_streaming(self, graphml_dataset, graph, mocker):
+        """Test that the streaming reader matches ``networkx.read_graphml``."""
+        graph.graph["name"] = "graph"
+        graph.add_node(3, label="node")
+        graphml_dataset.save(graph)
+        read_graphml_spy = mocker.spy(networkx, "read_graphml")
+
+        reloaded = graphml_dataset.load()
+
+        read_graphml_spy.assert_not_called()
+        expected = networkx.read_graphml(
+            graphml_dataset._filepath.as_posix(), node_type=int
+        )
+        assert type(reloaded) is type(expected)
+        assert reloaded.graph == expected.graph
+        assert list(reloaded.nodes(data=True)) == list(expected.nodes(data=True))
+        assert list(reloaded.edges(data=True)) == list(expected.edges(data=True))
+
+    @pytest.mark.parametrize("mode", ["rb", "r"])
+    @pytest.mark.parametrize("use_lxml", [True, False])
+    def test_load_parser(
+        self, filepath_graphml, dummy_graph_data, mocker, mode, use_lxml
+    ):
+        """Test loading with lxml and the standard library parser."""
+        if not use_lxml:
+            mocker.patch("kedro_datasets.networkx.graphml_dataset.etree", None)
+        lxml_spy = mocker.spy(etree, "iterparse")
+        dataset = GraphMLDataset(
+            filepath=filepath_graphml,
+            load_args={"node_type": int},
+            fs_args={"open_args_load": {"mode": mode}},
+        )
+        dataset.save(dummy_graph_data)
+
+        reloaded = dataset.load()
+
+        assert lxml_spy.called is (use_lxml and mode == "rb")
+        assert dummy_graph_data.nodes(data=True) == reloaded.nodes(data=True)
+        assert list(dummy_graph_data.edges) == list(reloaded.edges)
+
+    @pytest.mark.parametrize(
+        "fs_args,mapped",
+        [
+            (None, True),
+            ({"open_args_load": {"mode": "rb"}}, True),
+            ({"open_args_load": {"mode": "r"}}, False),
+            ({"open_args_load": {"mode": "rb", "compression": None}}, False),
+        ],
+    )
+    def test_load_mmap(
+        self, filepath_graphml, dummy_graph_data, mocker, fs_args, mapped
+    ):
+        """Test that local files opened in binary mode are memory-mapped."""
+        mmap_spy = mocker.spy(mmap, "mmap")
+        dataset = GraphMLDataset(
+            filepath=filepath_graphml, load_args={"node_type": int}, fs_args=fs_args
+        )
+        dataset.save(dummy_graph_data)
+
+        reloaded = dataset.load()
+
+        assert mmap_spy.called is mapped
+        assert dummy_graph_data.nodes(data=True) == reloaded.nodes(data=True)
+        assert list(dummy_graph_data.edges) == list(reloaded.edges)
+
+    def test_load_empty_file(self, graphml_dataset, filepath_graphml, mocker):
+        """Test that empty files are parsed without memory-mapping them."""
+        Path(filepath_graphml).parent.mkdir(parents=True)
+        Path(filepath_graphml).touch()
+        mmap_spy = mocker.spy(mmap, "mmap")
+
+        with pytest.raises(DatasetError):
+            graphml_dataset.load()
+        mmap_spy.assert_not_called()
+
+    def test_load_without_namespace(self, graphml_dataset, filepath_graphml, mocker):
+        """Test falling back to ``networkx.read_graphml`` without a namespace."""
+        Path(filepath_graphml).parent.mkdir(parents=True)
+        Path(filepath_graphml).write_text(
+            '<graphml><graph edgedefault="undirected">'
+            '<node id="0"/><node id="1"/><edge source="0" target="1"/>'
+            "</graph></graphml>"
+        )
+        read_graphml_spy = mocker.spy(networkx, "read_graphml")
+
+        reloaded = graphml_dataset.load()
+
+        read_graphml_spy.assert_called_once()
+        assert list(reloaded.edges) == [(0, 1)]
+
+    def test_load_edges_before_nodes(self, filepath_graphml, mocker):
+        """Test that edges preceding their nodes are added after all nodes, as
+        ``networkx.read_graphml`` does."""
+        Path(filepath_graphml).parent.mkdir(parents=True)
+        Path(filepath_graphml).write_text(
+            '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">'
+            '<graph edgedefault="undirected">'
+            '<node id="c"/><node id="d"/><edge source="d" target="c"/>'
+            '<edge source="a" target="b"/><node id="b"/><node id="a"/>'
+            '<edge source="c" target="b"/>'
+            "</graph></graphml>"
+        )
+        read_graphml_spy = mocker.spy(networkx, "read_graphml")
+        dataset = GraphMLDataset(filepath=filepath_graphml)
+
+        reloaded = dataset.load()
+        expected = networkx.read_graphml(filepath_graphml)
+
+        assert read_graphml_spy.call_count == 1
+        assert list(reloaded.nodes) == list(expected.nodes)
+        assert list(reloaded.edges) == list(expected.edges)
+
+    def test_load_key_defaults(self, graphml_dataset, filepath_graphml):
+        """Test that key defaults are stored on the loaded graph."""
+        Path(filepath_graphml).parent.mkdir(parents=True)
+        Path(filepath_graphml).write_text(
+            '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">'
+            '<key id="d0" for="node" attr.name="color" attr.type="string">'
+            "<default>red</default></key>"
+            '<key id="d1" for="edge" attr.name="weight" attr.type="double">'
+            "<default>1.0</default></key>"
+            '<graph edgedefault="directed"><node id="0"/><node id="1"/>'
+            '<edge source="0" target="1"/></graph></graphml>'
+        )
+        reloaded = graphml_dataset.load()
+
+        expected = networkx.read_graphml(filepath_graphml, node_type=int)
+        assert reloaded.graph == expected.graph
+        assert reloaded.graph["node_default"] == {"color": "red"}
+        assert reloaded.graph["edge_default"] == {"weight": 1.0}
+
+    @pytest.mark.parametrize("use_lxml", [True, False])
+    def test_load_trailing_graph_data(
+        self, graphml_dataset, filepath_graphml, mocker, use_lxml
+    ):
+        """Test that graph data after the nodes and edges is kept."""
+        if not use_lxml:
+            mocker.patch("kedro_datasets.networkx.graphml_dataset.etree", None)
+        Path(filepath_graphml).parent.mkdir(parents=True)
+        Path(filepath_graphml).write_text(
+            '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">'
+            '<key id="d0" for="graph" attr.name="name" attr.type="string"/>'
+            '<graph edgedefault="undirected">'
+            '<node id="0"/><node id="1"/><node id="2"/>'
+            '<edge source="0" target="1"/><edge source="1" target="2"/>'
+            '<data key="d0">hello</data></graph></graphml>'
+        )
+        reloaded = graphml_dataset.load()
+
+        expected = networkx.read_graphml(filepath_graphml, node_type=int)
+        assert reloaded.graph == expected.graph
+        assert reloaded.graph["name"] == "hello"
+        assert list(reloaded.edges) == list(expected.edges)
+
+    def test_load_hyperedge(self, graphml_dataset, filepath_graphml):
+        """Check the error when loading a graph with hyperedges."""
+        Path(filepath_graphml).parent.mkdir(parents=True)
+        Path(filepath_graphml).write_text(
+            '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">'
+            '<graph edgedefault="undirected"><node id="0"/>'
+            '<hyperedge><endpoint node="0"/></hyperedge>'
+            "</graph></graphml>"
+        )
+        pattern = r"GraphML reader doesn't support hyperedges"
+        with pytest.raises(DatasetError, match=pattern):
+            graphml_dataset.load()
+
+    def test_load_unsupported_args(self, filepath_graphml, dummy_graph_data, mocker):
+        """Test that unknown load arguments are passed to ``networkx.read_graphml``."""
+        GraphMLDataset(filepath=filepath_graphml).save(dummy_graph_data)
+        mocked_read_graphml = mocker.patch("networkx.read_graphml")
+        dataset = GraphMLDataset(filepath=filepath_graphml, load_args={"k1": "v1"})
+
+        assert dataset.load() is mocked_read_graphml.return_value
+        mocked_read_graphml.assert_called_once_with(mocker.ANY, k1="v1")
+
     def test_load_missing_file(self, graphml_dataset):
         """Check the error when trying to load missing file."""
         pattern = r"Failed while loading data from data set GraphMLDataset\(.*\)"
@@ -105,6 +291,29 @@ class TestGraphMLDataset:
         assert str(dataset._filepath) == path
         assert isinstance(dataset._filepath, PurePosixPath)
 
+    @pytest.mark.parametrize(
+        "fs_args,expected",
+        [
+            (None, {"mode": "rb", "cache_type": "readahead", "block_size": 16777216}),
+            (
+                {"open_args_load": {"cache_type": "blockcache", "block_size": 1024}},
+                {"mode": "rb", "cache_type": "blockcache", "block_size": 1024},
+            ),
+        ],
+    )
+    def test_remote_open_args_load(self, fs_args, expected):
+        """Test the read-ahead defaults for remote filesystems."""
+        dataset = GraphMLDataset(filepath="s3://bucket/file.graphml", fs_args=fs_args)
+        assert dataset._fs_open_args_load == expected
+
+    def test_filesystem_shared(self):
+        """Test that datasets with the same protocol and credentials share
+        one filesystem instance, and therefore its connections."""
+        credentials = {"key": "key", "secret": "secret"}
+        first = GraphMLDataset("s3://bucket/a.graphml", credentials=credentials)
+        second = GraphMLDataset("s3://bucket/b.graphml", credentials=credentials)
+        assert first._fs is second._fs
+
     def test_catalog_release(self, mocker):
         fs_mock = mocker.patch("fsspec.filesystem").return_value
         filepath = "test.graphml"
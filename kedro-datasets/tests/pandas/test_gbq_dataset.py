@@ -3,13 +3,19 @@ from pathlib import PosixPath
 
 import pandas as pd
 import pytest
+from google.cloud import bigquery
 from google.cloud.exceptions import NotFound
 from pandas.testing import assert_frame_equal
+from requests.adapters import HTTPAdapter
 
 from kedro_datasets import KedroDeprecationWarning
 from kedro_datasets._io import DatasetError
 from kedro_datasets.pandas import GBQQueryDataset, GBQTableDataset
-from kedro_datasets.pandas.gbq_dataset import _DEPRECATED_CLASSES
+from kedro_datasets.pandas.gbq_dataset import (
+    _DEPRECATED_CLASSES,
+    _get_bq_client,
+    _get_credentials,
+)
 
 DATASET = "dataset"
 TABLE_NAME = "table_name"
@@ -17,6 +23,12 @@ PROJECT = "project"
 SQL_QUERY = "SELECT * FROM table_a"
 
 
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    _get_bq_client.cache_clear()
+    _get_credentials.cache_clear()
+
+
 @pytest.fixture
 def dummy_dataframe():
     return pd.DataFrame({"col1": [1, 2], "col2": [4, 5], "col3": [5, 6]})
@@ -25,6 +37,8 @@ def dummy_dataframe():
 @pytest.fixture
 def mock_bigquery_client(mocker):
     mocked = mocker.patch("google.cloud.bigquery.Client", autospec=True)
+    mocked.return_value.project = PROJECT
+    mocked.return_value._http.is_mtls = False
     return mocked
 
 
@@ -90,6 +104,52 @@ class TestGBQDataset:
         assert not dataset.exists()
         assert dataset.exists()
 
+    def test_exists_cached(self, gbq_dataset, mock_bigquery_client):
+        """Test that the table is looked up once it is known to exist."""
+        get_table = mock_bigquery_client.return_value.get_table
+
+        assert gbq_dataset.exists()
+        assert gbq_dataset.exists()
+        get_table.assert_called_once_with(
+            bigquery.TableReference(
+                bigquery.DatasetReference(PROJECT, DATASET), TABLE_NAME
+            )
+        )
+
+        gbq_dataset.invalidate_cache()
+        assert gbq_dataset.exists()
+        assert get_table.call_count == 2
+
+    @pytest.mark.parametrize(
+        "save_args", [{"if_exists": "replace"}, {"table_schema": []}], indirect=True
+    )
+    def test_exists_after_save(
+        self, gbq_dataset, dummy_dataframe, mock_bigquery_client, mocker, save_args
+    ):
+        """Test that a saved table is known to exist without looking it up."""
+        mocker.patch("pandas.DataFrame.to_gbq")
+        gbq_dataset.save(dummy_dataframe)
+
+        assert gbq_dataset.exists()
+        mock_bigquery_client.return_value.get_table.assert_not_called()
+
+    def test_http_connection_pool(self, gbq_dataset, mock_bigquery_client):
+        """Test that the client's session keeps a pool of connections."""
+        mount = mock_bigquery_client.return_value._http.mount
+        mount.assert_called_once()
+        prefix, adapter = mount.call_args.args
+        assert prefix == "https://"
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter._pool_connections == 20
+        assert adapter._pool_maxsize == 20
+
+    def test_http_connection_pool_mtls(self, mock_bigquery_client):
+        """Test that the adapter of a mutual TLS session is not replaced."""
+        mock_bigquery_client.return_value._http.is_mtls = True
+        GBQTableDataset(DATASET, TABLE_NAME, project=PROJECT)
+
+        mock_bigquery_client.return_value._http.mount.assert_not_called()
+
     @pytest.mark.parametrize(
         "load_args", [{"k1": "v1", "index": "value"}], indirect=True
     )
@@ -106,11 +166,10 @@ class TestGBQDataset:
         for key, value in save_args.items():
             assert gbq_dataset._save_args[key] == value
 
-    def test_load_missing_file(self, gbq_dataset, mocker):
+    def test_load_missing_file(self, gbq_dataset, mock_bigquery_client):
         """Check the error when trying to load missing table."""
         pattern = r"Failed while loading data from data set GBQTableDataset\(.*\)"
-        mocked_read_gbq = mocker.patch("kedro_datasets.pandas.gbq_dataset.pd.read_gbq")
-        mocked_read_gbq.side_effect = ValueError
+        mock_bigquery_client.return_value.list_rows.side_effect = NotFound("NotFound")
         with pytest.raises(DatasetError, match=pattern):
             gbq_dataset.load()
 
@@ -143,34 +202,140 @@ class TestGBQDataset:
         for k in load_args.keys():
             assert k in str_repr
 
-    def test_save_load_data(self, gbq_dataset, dummy_dataframe, mocker):
+    def test_save_load_data(
+        self, gbq_dataset, dummy_dataframe, mock_bigquery_client, mocker
+    ):
         """Test saving and reloading the data set."""
-        sql = f"select * from {DATASET}.{TABLE_NAME}"
         table_id = f"{DATASET}.{TABLE_NAME}"
-        mocked_read_gbq = mocker.patch("kedro_datasets.pandas.gbq_dataset.pd.read_gbq")
-        mocked_read_gbq.return_value = dummy_dataframe
+        mock_bigquery_client.return_value.get_table.side_effect = NotFound("NotFound")
+        rows = mock_bigquery_client.return_value.list_rows.return_value
+        rows.to_dataframe.return_value = dummy_dataframe
         mocked_df = mocker.Mock()
 
         gbq_dataset.save(mocked_df)
         loaded_data = gbq_dataset.load()
 
-        mocked_df.to_gbq.assert_called_once_with(
-            table_id, project_id=PROJECT, credentials=None, progress_bar=False
+        mocked_df.to_gbq.assert_not_called()
+        load_table = mock_bigquery_client.return_value.load_table_from_dataframe
+        load_table.assert_called_once_with(mocked_df, table_id, job_config=mocker.ANY)
+        load_table.return_value.result.assert_called_once_with()
+        job_config = load_table.call_args.kwargs["job_config"]
+        assert job_config.source_format == "PARQUET"
+        assert job_config.write_disposition == "WRITE_EMPTY"
+        mock_bigquery_client.return_value.list_rows.assert_called_once_with(
+            bigquery.TableReference(
+                bigquery.DatasetReference(PROJECT, DATASET), TABLE_NAME
+            )
         )
+        rows.to_dataframe.assert_called_once_with(create_bqstorage_client=True)
+        assert_frame_equal(dummy_dataframe, loaded_data)
+
+    @pytest.mark.parametrize(
+        "load_args,save_args",
+        [
+            ({"query": "Select 1"}, None),
+            ({"query": "Select 1", "location": "EU"}, {"location": "EU"}),
+        ],
+        indirect=True,
+    )
+    def test_load_with_query(
+        self, gbq_dataset, dummy_dataframe, mock_bigquery_client, load_args
+    ):
+        """Test loading data set with query in the argument."""
+        result = mock_bigquery_client.return_value.query.return_value.result
+        result.return_value.to_dataframe.return_value = dummy_dataframe
+        loaded_data = gbq_dataset.load()
+
+        mock_bigquery_client.return_value.query.assert_called_once_with(
+            load_args["query"], location=load_args.get("location")
+        )
+        result.return_value.to_dataframe.assert_called_once_with(
+            create_bqstorage_client=True
+        )
+        assert_frame_equal(dummy_dataframe, loaded_data)
+
+    @pytest.mark.parametrize(
+        "load_args", [{"use_bqstorage_api": False}, {"reauth": True}], indirect=True
+    )
+    def test_read_gbq(self, gbq_dataset, dummy_dataframe, mocker, load_args):
+        """Test loading data set with pandas-gbq."""
+        sql = f"select * from {DATASET}.{TABLE_NAME}"
+        mocked_read_gbq = mocker.patch("kedro_datasets.pandas.gbq_dataset.pd.read_gbq")
+        mocked_read_gbq.return_value = dummy_dataframe
+        loaded_data = gbq_dataset.load()
+
         mocked_read_gbq.assert_called_once_with(
-            project_id=PROJECT, credentials=None, query=sql
+            project_id=PROJECT, credentials=None, query=sql, **load_args
         )
         assert_frame_equal(dummy_dataframe, loaded_data)
 
-    @pytest.mark.parametrize("load_args", [{"query": "Select 1"}], indirect=True)
+    @pytest.mark.parametrize(
+        "save_args,write_disposition",
+        [
+            ({"if_exists": "replace"}, "WRITE_TRUNCATE"),
+            ({"if_exists": "append", "chunk_size": 100}, "WRITE_APPEND"),
+        ],
+        indirect=["save_args"],
+    )
+    def test_save_write_disposition(
+        self, gbq_dataset, dummy_dataframe, mock_bigquery_client, write_disposition
+    ):
+        """Test translating ``if_exists`` to the load job write disposition."""
+        gbq_dataset.save(dummy_dataframe)
+
+        load_table = mock_bigquery_client.return_value.load_table_from_dataframe
+        job_config = load_table.call_args.kwargs["job_config"]
+        assert job_config.write_disposition == write_disposition
+
+    def test_save_fail_table_exists(
+        self, gbq_dataset, dummy_dataframe, mock_bigquery_client
+    ):
+        """Check the error when ``if_exists`` is ``fail`` and the table exists,
+        even if it is empty."""
+        pattern = r"Table 'dataset.table_name' already exists"
+        with pytest.raises(DatasetError, match=pattern):
+            gbq_dataset.save(dummy_dataframe)
+
+        load_table = mock_bigquery_client.return_value.load_table_from_dataframe
+        load_table.assert_not_called()
+
+    @pytest.mark.parametrize("save_args", [{"if_exists": "unknown"}], indirect=True)
+    def test_save_invalid_if_exists(self, gbq_dataset, dummy_dataframe):
+        """Check the error when ``if_exists`` has an unknown value."""
+        pattern = r"'unknown' is not valid for if_exists"
+        with pytest.raises(DatasetError, match=pattern):
+            gbq_dataset.save(dummy_dataframe)
+
+    @pytest.mark.parametrize(
+        "save_args",
+        [{"table_schema": [{"name": "col1", "type": "INTEGER"}]}],
+        indirect=True,
+    )
+    def test_save_to_gbq(self, gbq_dataset, mock_bigquery_client, mocker, save_args):
+        """Test saving data set with pandas-gbq."""
+        mocked_df = mocker.Mock()
+        gbq_dataset.save(mocked_df)
+
+        mocked_df.to_gbq.assert_called_once_with(
+            f"{DATASET}.{TABLE_NAME}",
+            project_id=PROJECT,
+            credentials=None,
+            progress_bar=False,
+            **save_args,
+        )
+        mock_bigquery_client.return_value.load_table_from_dataframe.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "load_args", [{"query": "Select 1", "reauth": True}], indirect=True
+    )
     def test_read_gbq_with_query(self, gbq_dataset, dummy_dataframe, mocker, load_args):
-        """Test loading data set with query in the argument."""
+        """Test loading data set with query in the argument with pandas-gbq."""
         mocked_read_gbq = mocker.patch("kedro_datasets.pandas.gbq_dataset.pd.read_gbq")
         mocked_read_gbq.return_value = dummy_dataframe
         loaded_data = gbq_dataset.load()
 
         mocked_read_gbq.assert_called_once_with(
-            project_id=PROJECT, credentials=None, query=load_args["query"]
+            project_id=PROJECT, credentials=None, **load_args
         )
 
         assert_frame_equal(dummy_dataframe, loaded_data)
@@ -212,6 +377,66 @@ class TestGBQDataset:
         )
 
 
+def test_query_metadata_positional(mock_bigquery_client):
+    """Test that ``metadata`` can still be passed positionally."""
+    metadata = {"owner": "team"}
+    dataset = GBQQueryDataset(SQL_QUERY, PROJECT, None, None, None, None, metadata)
+    assert dataset.metadata == metadata
+
+
+def test_client_shared(mock_bigquery_client, mocker):
+    """Test that datasets with the same project, credentials and location share
+    one BigQuery client."""
+    mocked_credentials = mocker.patch(
+        "kedro_datasets.pandas.gbq_dataset.Credentials",
+        side_effect=lambda **kwargs: mocker.Mock(),
+    )
+    credentials = {"token": "my_token", "scopes": ["scope"]}
+    table_dataset = GBQTableDataset(
+        DATASET, TABLE_NAME, project=PROJECT, credentials=dict(credentials)
+    )
+    query_dataset = GBQQueryDataset(
+        SQL_QUERY, project=PROJECT, credentials=dict(credentials)
+    )
+    GBQQueryDataset(SQL_QUERY, project="other", credentials=None)
+
+    assert table_dataset._credentials is query_dataset._credentials
+    mocked_credentials.assert_called_once_with(token="my_token", scopes=["scope"])
+    assert table_dataset._client is query_dataset._client
+    assert mock_bigquery_client.call_count == 2
+    mock_bigquery_client.assert_called_with(
+        project="other", credentials=None, location=None
+    )
+
+
+def test_nested_credentials(mock_bigquery_client, mocker):
+    """Test that credentials with nested values are shared between datasets."""
+    mocked_credentials = mocker.patch(
+        "kedro_datasets.pandas.gbq_dataset.Credentials",
+        side_effect=lambda **kwargs: mocker.Mock(),
+    )
+    credentials = {"token": "my_token", "trust_boundary": {"locations": ["eu"]}}
+    first = GBQTableDataset(DATASET, TABLE_NAME, credentials=credentials)
+    second = GBQQueryDataset(SQL_QUERY, credentials=credentials)
+
+    assert first._credentials is second._credentials
+    mocked_credentials.assert_called_once_with(**credentials)
+
+
+def test_unserialisable_credentials(mock_bigquery_client, mocker):
+    """Test that credentials which cannot be serialised are not shared."""
+    mocked_credentials = mocker.patch(
+        "kedro_datasets.pandas.gbq_dataset.Credentials",
+        side_effect=lambda **kwargs: mocker.Mock(),
+    )
+    credentials = {"token": "my_token", "expiry": object()}
+    first = GBQTableDataset(DATASET, TABLE_NAME, credentials=credentials)
+    second = GBQTableDataset(DATASET, TABLE_NAME, credentials=credentials)
+
+    assert first._credentials is not second._credentials
+    assert mocked_credentials.call_count == 2
+
+
 class TestGBQQueryDataset:
     def test_empty_query_error(self):
         """Check the error when instantiating with empty query or file"""
@@ -277,6 +502,32 @@ class TestGBQQueryDataset:
 
         assert_frame_equal(dummy_dataframe, loaded_data)
 
+    @pytest.mark.parametrize(
+        "eager_sql,expected_query", [(True, SQL_QUERY), (False, "SELECT 1")]
+    )
+    def test_load_query_file_eager(
+        self,
+        mocker,
+        sql_file,
+        dummy_dataframe,
+        mock_bigquery_client,
+        eager_sql,
+        expected_query,
+    ):
+        """Test that the query file is read once unless ``eager_sql`` is False."""
+        mocked_read_gbq = mocker.patch("kedro_datasets.pandas.gbq_dataset.pd.read_gbq")
+        mocked_read_gbq.return_value = dummy_dataframe
+        dataset = GBQQueryDataset(
+            filepath=sql_file, project=PROJECT, credentials=None, eager_sql=eager_sql
+        )
+        PosixPath(sql_file).write_text("SELECT 1")
+
+        dataset.load()
+
+        mocked_read_gbq.assert_called_once_with(
+            project_id=PROJECT, credentials=None, query=expected_query
+        )
+
     def test_save_error(self, gbq_sql_dataset, dummy_dataframe):
         """Check the error when trying to save to the data set"""
         pattern = r"'save' is not supported on GBQQueryDataset"
@@ -292,6 +543,10 @@ class TestGBQQueryDataset:
         )
         assert sql_file not in str_repr
 
+    def test_describe_cached(self, gbq_sql_dataset):
+        """Test that the description is built once, when the dataset is created."""
+        assert gbq_sql_dataset._describe() is gbq_sql_dataset._describe()
+
     def test_str_representation_filepath(self, gbq_sql_file_dataset, sql_file):
         """Test the data set instance string representation with filepath arg."""
         str_repr = str(gbq_sql_file_dataset)